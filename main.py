@@ -29,16 +29,24 @@ Dependencies:
 * CustomTkinter for the GUI components.
 * Pillow for image processing (background and banner images)
 * Callable for typehinting
-* strftime and subprocess for handling time formatting and executing system
+* datetime and subprocess for handling time formatting and executing system
   commands.
 
 This project was made possible by Mehraz Ahmed with the help of Imraan Khan.
 """
+import hashlib
+import os
+import re
 import subprocess
-from time import strftime
-from typing import Callable
-
-from PIL import Image
+import sys
+import tempfile
+import tkinter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Sequence
+
+from PIL import Image, ImageTk
 import customtkinter as ctk
 from customtkinter import CTkImage
 
@@ -60,6 +68,11 @@ SCALING_FACTOR = 1.5  # Scale everything by 1.5
 # BACKGROUND_PATH = "./assets/4k_backgrounds/belltower-night-3840x2160.jpg"
 BACKGROUND_PATH = "./assets/background.jpg"  # belltower night no writing
 BANNER_PATH = "./assets/banner.png"
+# Resized backgrounds are cached here as PPM files, which Tk loads natively
+IMAGE_CACHE_DIR = "./assets/.cache"
+
+# Command run with the user's full name once the input has been saved
+SAY_COMMAND = ("/usr/bin/say",)
 
 # Colors
 REYNOLDS_RED = "#990000"
@@ -81,6 +94,14 @@ DISTANCE_BETWEEN_ENTRY_Y = 5
 STANDARD_PADY = 10
 STANDARD_PADX = 20
 
+# Scaled values are precomputed once since SCALING_FACTOR never changes.
+_SCALE_CACHE = {value: int(value * SCALING_FACTOR)
+                for value in (SMALL_FONT_SIZE, SMALLER_FONT_SIZE,
+                              STANDARD_FONT_SIZE, LARGER_FONT_SIZE,
+                              DISTANCE_BETWEEN_ENTRY_X,
+                              DISTANCE_BETWEEN_ENTRY_Y,
+                              STANDARD_PADY, STANDARD_PADX)}
+
 ctk.set_appearance_mode("dark")
 
 
@@ -94,9 +115,23 @@ def scale(value):
     Returns:
         int: The scaled value, rounded down to the nearest integer.
     """
-    return int(value * SCALING_FACTOR)
+    scaled = _SCALE_CACHE.get(value)
+    if scaled is None:
+        scaled = int(value * SCALING_FACTOR)
+    return scaled
 
 
+# Scaled paddings used when placing widgets
+_ENTRY_PADX = scale(DISTANCE_BETWEEN_ENTRY_X)
+_ENTRY_PADY = scale(DISTANCE_BETWEEN_ENTRY_Y)
+_STANDARD_PADX = scale(STANDARD_PADX)
+_STANDARD_PADY = scale(STANDARD_PADY)
+_ACK_PADX = scale(STANDARD_PADX * 2.5)
+_ACK_PADY = scale(STANDARD_PADY * 5)
+_ACK_BUTTON_PADY = scale(STANDARD_PADX // 2)
+
+
+@lru_cache(maxsize=None)
 def get_font(scaling: int, bold: bool = False) -> tuple[str, int, str]:
     """
     Retrieve font configuration based on scaling and style.
@@ -109,7 +144,8 @@ def get_font(scaling: int, bold: bool = False) -> tuple[str, int, str]:
     Returns:
         tuple[str, int, str]: A tuple containing the font name,
                               the scaled size, and an optional style
-                              string (e.g., "bold").
+                              string (e.g., "bold"). The tuple is cached
+                              and shared between widgets.
     """
     if bold:
         return (BASE_FONT, scale(scaling), "normal")
@@ -126,33 +162,116 @@ def get_buildings_list(filename: str) -> list[str]:
     Returns:
         list[str]: List of parsed information
     """
-    info_list = []
+    lines = Path(filename).read_text(encoding="utf-8").splitlines()
+    info_list = [sys.intern(stripped)
+                 for stripped in (line.strip() for line in lines) if stripped]
+    info_list.sort()
+
+    return info_list
+
+
+def get_background_cache_path(source_path: Path, width: int,
+                              height: int) -> Path:
+    """
+    Build the cache file path for a background resized to the given size.
 
-    with open(filename, "r", encoding="utf-8") as file:
-        for line in file:
-            if line.strip() != "":
-                info_list.append(line.strip())
+    The name includes a digest of the source's resolved path, modification
+    time and size, so a different or changed source never reuses the cache.
 
-    return sorted(info_list)
+    Args:
+        source_path (Path): The file path of the original image.
+        width (int): The width the image is resized to.
+        height (int): The height the image is resized to.
+
+    Returns:
+        Path: The path of the PPM file in IMAGE_CACHE_DIR.
+    """
+    stat = source_path.stat()
+    source_key = f"{source_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha256(source_key.encode("utf-8")).hexdigest()[:16]
+    return (Path(IMAGE_CACHE_DIR)
+            / f"{source_path.stem}-{digest}-{width}x{height}.ppm")
+
+
+def remove_stale_background_caches(cache_path: Path, stem: str) -> None:
+    """
+    Delete cached backgrounds of the same source image other than the given
+    one, such as those of an older version of the image or another screen
+    resolution.
+
+    Args:
+        cache_path (Path): The cache file to keep.
+        stem (str): The stem of the source image the caches were made from.
+
+    Returns:
+        None: This function does not return a value.
+    """
+    pattern = re.compile(rf"{re.escape(stem)}-[0-9a-f]{{16}}-\d+x\d+\.ppm")
+    for stale_path in cache_path.parent.iterdir():
+        if stale_path != cache_path and pattern.fullmatch(stale_path.name):
+            try:
+                stale_path.unlink()
+            except OSError:
+                pass  # Left for a later run to clean up
 
 
 def load_background(tk: ctk.CTk, image_path: str):
     """
     Load and scale an image to fit the dimensions of a CTk window.
 
+    The resized image is cached as a PPM file in IMAGE_CACHE_DIR, so later
+    runs at the same resolution skip decoding and resizing the original.
+
     Args:
         tk (ctk.CTk): The CTk instance whose dimensions are used
                       for scaling the image.
         image_path (str): The file path of the image to be loaded.
 
     Returns:
-        CTkImage: A CTkImage object resized to fit the window dimensions.
+        tkinter.PhotoImage | ImageTk.PhotoImage: A PhotoImage resized to fit
+                                                 the window dimensions.
     """
-    img = Image.open(image_path)
     width = tk.winfo_width()
     height = tk.winfo_height()
 
-    return CTkImage(img, size=(width, height))
+    source_path = Path(image_path)
+    cache_path = get_background_cache_path(source_path, width, height)
+    if cache_path.exists():
+        try:
+            return tkinter.PhotoImage(file=str(cache_path))
+        except tkinter.TclError:
+            pass  # Unreadable cache, rebuild it from the source image
+
+    img = Image.open(source_path)
+
+    # Let the JPEG decoder downscale while decoding, then resize only once so
+    # the full resolution pixels are never kept around.
+    img.draft("RGB", (width, height))
+    img = img.resize((width, height), Image.Resampling.BILINEAR)
+    img = img.convert("RGB")
+
+    # Write to a temporary file first so an interrupted write never leaves a
+    # truncated image at the cache path.
+    temp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".ppm",
+                                              dir=cache_path.parent)
+        os.close(temp_fd)
+        img.save(temp_path, "PPM")
+        # mkstemp creates the file as 0600, keep the cache readable by other
+        # accounts like the log file.
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, cache_path)
+        remove_stale_background_caches(cache_path, source_path.stem)
+    except OSError:
+        # Caching is best effort, e.g. on a read-only install
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    # The fullscreen window never rescales, so a plain PhotoImage is used
+    # instead of a CTkImage to stay out of CustomTkinter's scaling tracker.
+    return ImageTk.PhotoImage(img)
 
 
 def load_banner(image_path: str):
@@ -167,36 +286,40 @@ def load_banner(image_path: str):
     """
     img = Image.open(image_path)
     width, height = img.size
-    # resized_img = img.resize(
-    #     (int(width * 0.5), int(height * 0.5)), Image.Resampling.LANCZOS)
-    return CTkImage(img, size=(int(width * 0.5), int(height * 0.5)))
+    size = (int(width * 0.5), int(height * 0.5))
+    resized_img = img.resize(size, Image.Resampling.LANCZOS)
+    return CTkImage(resized_img, size=size)
 
 
 def refresh_window() -> None:
     """
-    Refresh the program window by updating its tasks and rendering. This
-    ensures that any pending updates to the UI are processed immediately.
+    Refresh the program window by flushing pending idle tasks (redraws and
+    geometry updates) without processing other queued events.
 
     Returns:
         None: This function does not return a value.
     """
     root.update_idletasks()
-    root.update()
 
 
 def clear_root() -> None:
     """
-    Clear all widgets from the root window. Removes all child widgets managed
-    by the pack geometry manager and refreshes the window to reflect the
-    changes.
+    Clear all pages from the root window. Removes the previous page's
+    <Return> binding, hides all child widgets managed by the pack geometry
+    manager, so they can be shown again later. No refresh is forced, Tk lays
+    out the new page in a single pass once the event loop is idle.
 
     Returns:
         None: This function does not return a value.
     """
-    for widget in root.pack_slaves():
-        widget.destroy()
+    root.unbind("<Return>")
 
-    refresh_window()
+    # Only the current page is packed, so a bulk Tcl "pack forget" would not
+    # save anything. Going through each widget's pack_forget() also keeps
+    # CustomTkinter's geometry bookkeeping in sync, otherwise a DPI scaling
+    # change would re-pack the hidden page.
+    for widget in root.pack_slaves():
+        widget.pack_forget()
 
 
 def get_name_label(working_frame: ctk.CTkFrame,
@@ -221,24 +344,39 @@ def get_name_label(working_frame: ctk.CTkFrame,
     return label
 
 
-def grid_position(current_widget, row: int, col: int):
+def grid_label(current_label: ctk.CTkLabel, row: int, col: int) -> None:
     """
-    Places widgets in a grid layout with scaling and padding.
+    Places a label in a grid layout with scaling and padding, aligned to the
+    right of its cell.
 
     Args:
-        current_widget: The widget to be placed in the grid.
+        current_label (ctk.CTkLabel): The label to be placed in the grid.
         row (int): The row index in the grid layout.
         col (int): The column index in the grid layout.
 
     Returns:
-        None: This function places the widget in the grid and does not return
+        None: This function places the label in the grid and does not return
               a value.
     """
-    sticky = "e" if isinstance(current_widget, ctk.CTkLabel) else ""
-    return current_widget.grid(row=row, column=col,
-                               padx=scale(DISTANCE_BETWEEN_ENTRY_X),
-                               pady=scale(DISTANCE_BETWEEN_ENTRY_Y),
-                               sticky=sticky)
+    current_label.grid(row=row, column=col, padx=_ENTRY_PADX,
+                       pady=_ENTRY_PADY, sticky="e")
+
+
+def grid_entry(current_entry: ctk.CTkEntry, row: int, col: int) -> None:
+    """
+    Places an entry field in a grid layout with scaling and padding.
+
+    Args:
+        current_entry (ctk.CTkEntry): The entry field to be placed in the grid.
+        row (int): The row index in the grid layout.
+        col (int): The column index in the grid layout.
+
+    Returns:
+        None: This function places the entry field in the grid and does not
+              return a value.
+    """
+    current_entry.grid(row=row, column=col, padx=_ENTRY_PADX,
+                       pady=_ENTRY_PADY)
 
 
 def get_entry_field(current_frame: ctk.CTkFrame,
@@ -291,50 +429,36 @@ def name_input_page() -> None:
     Display the page for entering the user's first and last name, and handles
     navigation to the next page.
 
-    This function clears the root window, creates the necessary input fields
-    for the user's first and last name, and adds a button to proceed to the
-    next page after validating that both names have been entered.
+    This function clears the root window and shows the name input page, which
+    is built once at startup, with its entry fields emptied.
 
     Returns:
         None: This function does not return a value.
     """
     clear_root()
-
-    name_input_frame = ctk.CTkFrame(root)
     name_input_frame.pack(expand=True)
 
-    # bg = load_background(root, BACKGROUND_PATH)
-    # bg_label = ctk.CTkLabel(root, text="", image=bg)
-    # bg_label.place(x=0, y=0)
-
-    # banner_img = load_banner(BANNER_PATH)
-    # banner_img_label = ctk.CTkLabel(root, text="", image=banner_img)
-    # banner_img_label.place(x=0, y=0)
-
-    first_name = get_name_label(name_input_frame, "First")
-    grid_position(first_name, 0, 0)
-
-    first_name_entry = get_entry_field(name_input_frame, "First")
-    grid_position(first_name_entry, 0, 1)
-
+    first_name_entry.delete(0, "end")
+    last_name_entry.delete(0, "end")
     first_name_entry.focus()
 
-    last_name = get_name_label(name_input_frame, "Last")
-    grid_position(last_name, 1, 0)
-
-    last_name_entry = get_entry_field(name_input_frame, "Last")
-    grid_position(last_name_entry, 1, 1)
 
-    def proceed():
-        first_name = first_name_entry.get()
-        last_name = last_name_entry.get()
-        if first_name and last_name:
-            building_department_input(first_name, last_name)
+def proceed_from_name_input() -> None:
+    """
+    Move on to the department and building selection page once both the first
+    and last name have been entered. Does nothing while the name input page
+    is hidden.
 
-    name_button = make_button(name_input_frame, text="Next", command=proceed)
-    name_button.grid(row=2, columnspan=2, pady=scale(STANDARD_PADY))
+    Returns:
+        None: This function does not return a value.
+    """
+    if not name_input_frame.winfo_ismapped():
+        return
 
-    root.bind("<Return>", lambda event: proceed())
+    first_name = first_name_entry.get()
+    last_name = last_name_entry.get()
+    if first_name and last_name:
+        building_department_input(first_name, last_name)
 
 
 def get_selection_label(current_frame: ctk.CTkFrame,
@@ -355,20 +479,20 @@ def get_selection_label(current_frame: ctk.CTkFrame,
     text = f"Select your {selection}:"
     label = ctk.CTkLabel(current_frame, text=text,
                          font=get_font(STANDARD_FONT_SIZE))
-    label.pack(pady=scale(STANDARD_PADY), padx=scale(STANDARD_PADX))
+    label.pack(pady=_STANDARD_PADY, padx=_STANDARD_PADX)
     return label
 
 
 def get_dropdown(current_frame: ctk.CTkFrame,
-                 options_func: Callable[[], list[str]]
+                 options_func: Callable[[], Sequence[str]]
                  ) -> tuple[ctk.StringVar, ctk.CTkOptionMenu]:
     """
     Create a dropdown menu with dynamically provided options.
 
     Args:
         current_frame (ctk.CTkFrame): Frame for the dropdown.
-        options_func (Callable[[], list[str]]): Function returning the options
-                                                list.
+        options_func (Callable[[], Sequence[str]]): Function returning the
+                                                    options sequence.
 
     Returns:
         tuple[ctk.StringVar, ctk.CTkOptionMenu]: StringVar and CTkOptionMenu
@@ -378,9 +502,9 @@ def get_dropdown(current_frame: ctk.CTkFrame,
     options = options_func()
     dropdown_str_var.set(options[0] if options else "")
     dropdown = ctk.CTkOptionMenu(
-        current_frame, variable=dropdown_str_var, values=options)
-    dropdown.pack(pady=scale(STANDARD_PADY), padx=scale(20))
-    dropdown.configure(font=get_font(SMALL_FONT_SIZE))
+        current_frame, variable=dropdown_str_var, values=options,
+        font=get_font(SMALL_FONT_SIZE))
+    dropdown.pack(pady=_STANDARD_PADY, padx=_STANDARD_PADX)
     return dropdown_str_var, dropdown
 
 
@@ -397,22 +521,53 @@ DEPARTMENTS = {
     "Statistics": "NCSU-COS-STAT",
     "Other": "NCSU-COS"
 }
-
+_DEPARTMENT_NAMES = tuple(DEPARTMENTS)
+
+_DEPARTMENT_BUILDINGS_RAW = {
+    "Biology": (),
+    "Bioinformatics": (),
+    "Chemistry": ("SAS Hall", "Cox Hall",
+                  "Dabney Hall"),
+    "Mathematics": ("SAS Hall", "Cox Hall",
+                    "Dabney Hall", "Language and Computer Laboratories"),
+    "MEAS": (),
+    "Physics": (),
+    "SCO": (),
+    "Statistics": ("SAS Hall",),
+    "Other": ()  # All building options
+}
+# Share the building name strings with BUILDINGS.
 DEPARTMENT_BUILDINGS = {
-    "Biology": [],
-    "Bioinformatics": [],
-    "Chemistry": ["SAS Hall", "Cox Hall",
-                  "Dabney Hall"],
-    "Mathematics": ["SAS Hall", "Cox Hall",
-                    "Dabney Hall", "Language and Computer Laboratories"],
-    "MEAS": [],
-    "Physics": [],
-    "SCO": [],
-    "Statistics": ["SAS Hall"],
-    "Other": []  # All building options
+    department: tuple(sys.intern(building) for building in buildings)
+    for department, buildings in _DEPARTMENT_BUILDINGS_RAW.items()
 }
 
 
+def get_building_options() -> Sequence[str]:
+    """
+    Retrieve the building options for the currently selected department.
+
+    Returns:
+        Sequence[str]: The buildings of the selected department, or all
+                       buildings if the department is unknown.
+    """
+    department = department_str_var.get()
+    return DEPARTMENT_BUILDINGS.get(department, BUILDINGS)
+
+
+def update_building_dropdown(*args) -> None:  # pylint: disable=W0613
+    """
+    Refresh the building dropdown after the selected department changes.
+
+    Returns:
+        None: This function does not return a value.
+    """
+    options = get_building_options()
+    building_dropdown.configure(values=options)
+    if options:
+        building_str_var.set(options[0])
+
+
 def building_department_input(first_name: str, last_name: str) -> None:
     """Displays building and department selection, dynamically updating
     building options.
@@ -425,29 +580,9 @@ def building_department_input(first_name: str, last_name: str) -> None:
         None: This function does not return a value.
     """
     clear_root()
-    building_department_frame = ctk.CTkFrame(root)
     building_department_frame.pack(expand=True)
-
-    get_selection_label(building_department_frame, "department")
-
-    department_str_var = get_dropdown(
-        building_department_frame, lambda: list(DEPARTMENTS.keys()))[0]
-
-    def get_building_options():
-        department = department_str_var.get()
-        return DEPARTMENT_BUILDINGS.get(department, BUILDINGS)
-
-    get_selection_label(building_department_frame, "building")
-
-    building_str_var, building_dropdown = get_dropdown(
-        building_department_frame, get_building_options)
-
-    def update_building_dropdown(*args):  # pylint: disable=W0613
-        building_dropdown.configure(values=get_building_options())
-        if get_building_options():
-            building_str_var.set(get_building_options()[0])
-
-    department_str_var.trace_add("write", update_building_dropdown)
+    # Hidden widgets keep the keyboard focus, move it off the name entries.
+    building_department_frame.focus_set()
 
     def proceed():
         building = building_str_var.get()
@@ -455,10 +590,8 @@ def building_department_input(first_name: str, last_name: str) -> None:
             save_input(first_name, last_name,
                        department_str_var.get(), building)
 
-    submit_button = make_button(
-        building_department_frame, text="Submit", command=proceed)
+    submit_button.configure(command=proceed)
     root.bind("<Return>", lambda event: proceed())
-    submit_button.pack(pady=scale(STANDARD_PADY), padx=scale(STANDARD_PADX))
 
 
 def save_input(first_name: str, last_name: str,
@@ -480,13 +613,17 @@ def save_input(first_name: str, last_name: str,
     Returns:
         None: This function does not return a value.
     """
-    current_time = strftime("%Y-%m-%d %H:%M:%S")
-    command = f'/usr/bin/say "{first_name} {last_name}"'
-    # command = (
-    #     f'sudo /usr/bin/jamf recon -realname "{first_name} {last_name}"'
-    #     f' -building "{building}"'
-    #     # f' -department {DEPARTMENTS[department]}'
-    # )
+    current_time = datetime.now().isoformat(sep=" ", timespec="seconds")
+    # "--" stops a name starting with "-" from being read as an option.
+    command = [*SAY_COMMAND, "--", f"{first_name} {last_name}"]
+    # Each value follows its flag, so it is always read as that flag's
+    # argument and never as an option.
+    # command = [
+    #     "sudo", "/usr/bin/jamf", "recon",
+    #     "-realname", f"{first_name} {last_name}",
+    #     "-building", building,
+    #     # "-department", DEPARTMENTS[department],
+    # ]
 
     # jamf command:
     # /usr/local/bin/jamf recon [flags]
@@ -501,11 +638,50 @@ def save_input(first_name: str, last_name: str,
         f" - {building} - {DEPARTMENTS[department]} ({department})\n"
     )
 
-    with open("info_log.txt", "a", encoding="utf-8") as f:
-        f.write(formatted_information)
+    log_fd = os.open("info_log.txt", os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                     0o644)
+    try:
+        os.write(log_fd, formatted_information.encode("utf-8"))
+    finally:
+        os.close(log_fd)
+
+    # Not waited on, the command keeps running while the window is torn down.
+    # The window is closed even if the command cannot be started, otherwise
+    # the user is left in a fullscreen window that cannot be closed.
+    try:
+        subprocess.Popen(command)  # pylint: disable=R1732
+    except OSError:
+        pass
+    finally:
+        root.destroy()
+
+
+def load_images() -> None:
+    """
+    Load the background and banner images and place them behind the current
+    page. This is scheduled once the main loop is idle so the first page is
+    painted without waiting on image decoding, and so the window already has
+    its fullscreen dimensions when the background is sized.
+
+    Returns:
+        None: This function does not return a value.
+    """
+    refresh_window()
+
+    background = load_background(root, BACKGROUND_PATH)
+    background_label = tkinter.Label(root, image=background, borderwidth=0,
+                                     highlightthickness=0)
+    background_label.image = background  # Keep the PhotoImage alive
+    background_label.place(x=0, y=0)
 
-    subprocess.run(["bash", "-c", command], check=False)
-    root.destroy()
+    banner_image = load_banner(BANNER_PATH)
+    banner_label = ctk.CTkLabel(root, text="", image=banner_image)
+    banner_label.place(x=0, y=0)
+
+    # Widgets created later stack above earlier siblings, keep the images
+    # underneath the page that is already shown.
+    banner_label.lower()
+    background_label.lower()
 
 
 # Main window
@@ -515,25 +691,56 @@ root.attributes('-fullscreen', True)
 # root.overrideredirect(True)
 root.protocol("WM_DELETE_WINDOW", lambda: None)
 
-background = load_background(root, BACKGROUND_PATH)
-background_label = ctk.CTkLabel(root, text="", image=background)
-background_label.place(x=0, y=0)
-
-banner_image = load_banner(BANNER_PATH)
-banner_label = ctk.CTkLabel(root, text="", image=banner_image)
-banner_label.place(x=0, y=0)
-
 # Initial Page
-frame = ctk.CTkFrame(root)
-frame.pack(expand=True)
+acknowledge_frame = ctk.CTkFrame(root)
+acknowledge_frame.pack(expand=True)
 
-ctk.CTkLabel(frame, text=ACKNOWLEDGE_MESSAGE,
+ctk.CTkLabel(acknowledge_frame, text=ACKNOWLEDGE_MESSAGE,
              font=get_font(LARGER_FONT_SIZE, True),
-             pady=scale(STANDARD_PADY * 5), padx=scale(STANDARD_PADX * 2.5),
+             pady=_ACK_PADY, padx=_ACK_PADX,
              fg_color=REYNOLDS_RED).pack(expand=True)
 
 acknowledge_button = make_button(
-    frame, text="Next", command=name_input_page)
-acknowledge_button.pack(pady=scale(STANDARD_PADX // 2))
+    acknowledge_frame, text="Next", command=name_input_page)
+acknowledge_button.pack(pady=_ACK_BUTTON_PADY)
+
+# The remaining pages are built once up front and only packed when shown.
+
+# Name Input Page
+name_input_frame = ctk.CTkFrame(root)
+
+grid_label(get_name_label(name_input_frame, "First"), 0, 0)
+first_name_entry = get_entry_field(name_input_frame, "First")
+grid_entry(first_name_entry, 0, 1)
+
+grid_label(get_name_label(name_input_frame, "Last"), 1, 0)
+last_name_entry = get_entry_field(name_input_frame, "Last")
+grid_entry(last_name_entry, 1, 1)
+
+# Bound on the entries themselves since they hold the keyboard focus here.
+for name_entry in (first_name_entry, last_name_entry):
+    name_entry.bind("<Return>", lambda event: proceed_from_name_input())
+
+name_button = make_button(name_input_frame, text="Next",
+                          command=proceed_from_name_input)
+name_button.grid(row=2, columnspan=2, pady=_STANDARD_PADY)
+
+# Department and Building Selection Page
+building_department_frame = ctk.CTkFrame(root)
+
+get_selection_label(building_department_frame, "department")
+department_str_var = get_dropdown(
+    building_department_frame, lambda: _DEPARTMENT_NAMES)[0]
+
+get_selection_label(building_department_frame, "building")
+building_str_var, building_dropdown = get_dropdown(
+    building_department_frame, get_building_options)
+
+department_str_var.trace_add("write", update_building_dropdown)
+
+submit_button = make_button(building_department_frame, text="Submit",
+                            command=lambda: None)
+submit_button.pack(pady=_STANDARD_PADY, padx=_STANDARD_PADX)
 
+root.after_idle(load_images)
 root.mainloop()